@@ -1,9 +1,8 @@
 import os
 import sys
-import gradio as gr
 import time
 import logging
-import subprocess
+import shutil
 import traceback
 import threading
 
@@ -15,36 +14,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Include tracebacks in messages shown in the UI
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+# Installed tools don't change while the app is running, so detect them once
+STEAMCMD_PATH = "/app/steamcmd/steamcmd.sh"
+HAS_7ZIP = shutil.which("7z") is not None
+
+def _steamcmd_state():
+    """Return True if the SteamCMD script exists and is executable"""
+    try:
+        st = os.stat(STEAMCMD_PATH)
+    except OSError:
+        return False
+    return bool(st.st_mode & 0o111)
+
+HAS_STEAMCMD = _steamcmd_state()
+
+# Health reports are shared between sessions for a short time so that
+# concurrent page loads and refreshes don't each re-run the checks
+HEALTH_CACHE_TTL = 10
+_HEALTH_CACHE = {"t": 0.0, "v": None}
+_health_lock = threading.Lock()
+
+# Free disk space changes slowly, so statvfs results are kept longer than the
+# report itself. The cache lives in memory and starts empty on every restart.
+DISK_CACHE_TTL = 60
+_GB = 1 << 30
+_DISK_CACHE = [0.0, 0.0]
+
 def system_health_check():
+    """Return the system health report, reusing a recent one if available"""
+    with _health_lock:
+        if _HEALTH_CACHE["v"] is not None and time.monotonic() - _HEALTH_CACHE["t"] < HEALTH_CACHE_TTL:
+            return _HEALTH_CACHE["v"]
+        report = _run_health_check()
+        _HEALTH_CACHE["t"] = time.monotonic()
+        _HEALTH_CACHE["v"] = report
+        return report
+
+def _free_space_gb():
+    """Return free disk space on / in GB, refreshed at most once per DISK_CACHE_TTL"""
+    now = time.monotonic()
+    if _DISK_CACHE[0] and now - _DISK_CACHE[0] < DISK_CACHE_TTL:
+        return _DISK_CACHE[1]
+    logger.info("Checking disk space...")
+    _DISK_CACHE[0] = now
+    _DISK_CACHE[1] = shutil.disk_usage('/').free / _GB
+    return _DISK_CACHE[1]
+
+def _run_health_check():
     """Basic system health check that runs on startup"""
     try:
         # Check disk space
-        logger.info("Checking disk space...")
-        disk_usage = os.statvfs('/')
-        free_space_gb = (disk_usage.f_bavail * disk_usage.f_frsize) / (1024**3)
-        
-        # Check for 7zip
-        logger.info("Checking for 7zip...")
-        has_7zip = subprocess.run(["which", "7z"], capture_output=True).returncode == 0
-        
-        # Check for steamcmd
-        logger.info("Checking for steamcmd...")
-        steamcmd_path = "/app/steamcmd/steamcmd.sh"
-        has_steamcmd = os.path.exists(steamcmd_path)
+        free_space_gb = _free_space_gb()
         
         # Build health report
         report = [
             f"Available disk space: {free_space_gb:.2f} GB",
-            f"7zip installed: {'Yes' if has_7zip else 'No'}",
-            f"SteamCMD installed: {'Yes' if has_steamcmd else 'No'}"
+            f"7zip installed: {'Yes' if HAS_7ZIP else 'No'}",
+            f"SteamCMD installed: {'Yes' if HAS_STEAMCMD else 'No'}"
         ]
         
         logger.info("Health check complete: %s", ", ".join(report))
         return "\n".join(report)
     except Exception as e:
-        error_msg = f"Error during health check: {str(e)}\n{traceback.format_exc()}"
-        logger.error(error_msg)
-        return error_msg
+        logger.exception("Error during health check")
+        if DEBUG:
+            return f"Error during health check: {str(e)}\n{traceback.format_exc()}"
+        return f"Error during health check: {str(e)}"
 
 def update_status():
     """Function to manually update the status box"""
@@ -52,75 +90,80 @@ def update_status():
     health_status = system_health_check()
     return f"Server running at {timestamp}\n\n{health_status}"
 
-# Create a very simple Gradio app
-logger.info("Initializing Gradio app")
-with gr.Blocks(title="Railway App") as demo:
-    gr.Markdown("# Railway App - Minimal Demo")
-    
-    status_box = gr.Textbox(
-        label="System Status",
-        value="Starting...",
-        lines=10,
-        interactive=False
-    )
-    
-    # Add a refresh button instead of automatic updates
-    refresh_btn = gr.Button("Refresh Status")
-    refresh_btn.click(fn=update_status, inputs=None, outputs=status_box)
-    
-    # Update status initially
-    demo.load(update_status, None, [status_box])
-    
-    with gr.Row():
-        with gr.Column():
-            gr.Markdown("## Test Connection")
-            name_input = gr.Textbox(label="Your Name", value="User")
-            greet_output = gr.Textbox(label="Response")
-            
-            def greet(name):
-                timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"Greeting user: {name}")
-                return f"Hello, {name}! Server is up and running at {timestamp}."
-            
-            gr.Button("Test Connection").click(
-                fn=greet, 
-                inputs=[name_input], 
-                outputs=[greet_output]
-            )
-
-# Function to keep the container alive in a separate thread
-def keep_alive_thread():
-    while True:
-        logger.info("Keep-alive thread running...")
-        time.sleep(60)
-
-# Start the keep-alive thread
-threading.Thread(target=keep_alive_thread, daemon=True).start()
+def greet(name):
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    logger.info(f"Greeting user: {name}")
+    return f"Hello, {name}! Server is up and running at {timestamp}."
 
-# Launch the app
-try:
-    logger.info("Launching Gradio app...")
-    port = int(os.getenv("PORT", 7860))
+def build_ui():
+    """Create a very simple Gradio app"""
+    # Imported here so that importing this module doesn't pull in gradio
+    import gradio as gr
     
-    # Improved queue settings
-    demo.queue(concurrency_count=5)
-    demo.launch(
-        server_name="0.0.0.0",
-        server_port=port,
-        share=True,
-        debug=True,
-        show_error=True
-    )
+    logger.info("Initializing Gradio app")
+    with gr.Blocks(title="Railway App") as demo:
+        gr.Markdown("# Railway App - Minimal Demo")
+        
+        status_box = gr.Textbox(
+            label="System Status",
+            value="Starting...",
+            lines=10,
+            interactive=False
+        )
+        
+        # Add a refresh button instead of automatic updates
+        refresh_btn = gr.Button("Refresh Status")
+        # Cheap read-only endpoints bypass the queue so they never wait behind
+        # long-running jobs
+        refresh_btn.click(fn=update_status, inputs=None, outputs=status_box, queue=False)
+        
+        # Update status initially, outside the queue so page loads never
+        # wait behind other requests
+        demo.load(update_status, None, [status_box], queue=False)
+        
+        with gr.Row():
+            with gr.Column():
+                gr.Markdown("## Test Connection")
+                name_input = gr.Textbox(label="Your Name", value="User")
+                greet_output = gr.Textbox(label="Response")
+                
+                gr.Button("Test Connection").click(
+                    fn=greet, 
+                    inputs=[name_input], 
+                    outputs=[greet_output],
+                    queue=False
+                )
     
-    # This code should never be reached in normal operation
-    logger.warning("Gradio launch exited unexpectedly, entering backup loop")
-    while True:
-        time.sleep(60)
-        logger.info("Backup keep-alive loop running")
+    return demo
+
+if __name__ == "__main__":
+    # Launch the app; the blocking launch keeps the container alive
+    try:
+        logger.info("Launching Gradio app...")
+        demo = build_ui()
+        port = int(os.getenv("PORT", 7860))
+        
+        # Gradio 4 replaced concurrency_count with per-endpoint limits
+        demo.queue(default_concurrency_limit=8, max_size=64)
+        demo.launch(
+            server_name="0.0.0.0",
+            server_port=port,
+            # The container is already reachable on PORT; a share link relays
+            # all traffic through Gradio's tunnel, so it is opt-in
+            share=os.getenv("GRADIO_SHARE", "0") == "1",
+            debug=True,
+            show_error=True,
+            # Sync handlers run on this thread pool; size it for slow I/O-bound
+            # calls rather than CPU count
+            max_threads=int(os.getenv("THREAD_POOL_SIZE", 64))
+        )
+        
+        # This code should never be reached in normal operation
+        logger.warning("Gradio launch exited unexpectedly, keeping the process alive")
+        threading.Event().wait()
 
-except Exception as e:
-    logger.critical(f"Fatal error: {str(e)}\n{traceback.format_exc()}")
-    # Still try to keep the container alive
-    while True:
+    except Exception as e:
+        logger.critical("Fatal error: %s", e, exc_info=True)
+        # Still try to keep the container alive, parked instead of polling
         logger.error("Application crashed but keeping container alive")
-        time.sleep(300) 
\ No newline at end of file
+        threading.Event().wait() 
\ No newline at end of file
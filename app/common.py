@@ -5,11 +5,16 @@ import re
 import logging
 import shutil
 import signal
+import selectors
+import pty
 import json
 import hashlib
+import functools
+import tempfile
 from logging.handlers import RotatingFileHandler
 from datetime import datetime
 from queue import Queue
+from collections import deque
 import threading
 import secrets
 import dotenv
@@ -88,18 +93,64 @@ signal.signal(signal.SIGTERM, signal_handler)
 
 # === Utility Functions ===
 
+_GB = 1 << 30
+
+# Steam store URLs look like https://store.steampowered.com/app/<id>/<name>/
+_URL_APP_RE = re.compile(r"/app/(\d+)")
+# A bare numeric app ID, anchored so it can be checked with .match
+_NUM_RE = re.compile(r"\s*(\d+)\s*$")
+
+# Markers SteamCMD prints when a login fails. A Steam Guard marker wins over
+# a password one ("Login Failure: Two-factor code mismatch" is a 2FA problem).
+_GUARD_FAILURE_RE = re.compile(r"Steam Guard|Two-factor code")
+_PASSWORD_FAILURE_RE = re.compile(r"Invalid Password|Login Failure")
+
 def get_available_space(path):
     """Get available disk space in bytes for the given path."""
-    path = os.path.abspath(path)  # Ensure absolute path
     try:
-        result = subprocess.run(['df', '-k', path], capture_output=True, text=True)
-        lines = result.stdout.splitlines()
-        if len(lines) > 1:
-            return int(lines[1].split()[3]) * 1024
+        # A single statfs call instead of forking df and parsing its output
+        return shutil.disk_usage(path).free
     except Exception as e:
         logger.error(f"Error checking disk space: {str(e)}")
         return 0
-    return 0
+
+def _classify_login_failure(output):
+    """Return "guard", "password" or None for the output of a failed login."""
+    if _GUARD_FAILURE_RE.search(output):
+        return "guard"
+    if _PASSWORD_FAILURE_RE.search(output):
+        return "password"
+    return None
+
+# Tools found on PATH are remembered. Missing ones are looked up again, since
+# the installer may add them while the app is running.
+_TOOL_CACHE = set()
+
+def has_tool(name):
+    """Return True if an executable with this name is on PATH."""
+    if name in _TOOL_CACHE:
+        return True
+    if shutil.which(name) is None:
+        return False
+    _TOOL_CACHE.add(name)
+    return True
+
+def steamcmd_ready(steamcmd_path):
+    """Check that the SteamCMD script exists and is executable with a single stat."""
+    try:
+        st = os.stat(steamcmd_path)
+    except OSError:
+        return False
+    return bool(st.st_mode & 0o111)
+
+def probe_write(directory):
+    """Create and remove a temporary file to check that a directory is writable."""
+    fd, test_file = tempfile.mkstemp(prefix='.write_test_', dir=directory)
+    try:
+        os.write(fd, b'test')
+    finally:
+        os.close(fd)
+        os.remove(test_file)
 
 def verify_output_path(output_path):
     """Verify that the output path is valid and writable."""
@@ -118,10 +169,7 @@ def verify_output_path(output_path):
             logger.info(f"Created directory: {parent_dir}")
         
         # Check write permissions by creating a test file
-        test_file = os.path.join(parent_dir, f'.test_write_{secrets.token_hex(4)}')
-        with open(test_file, 'w') as f:
-            f.write('test')
-        os.remove(test_file)
+        probe_write(parent_dir)
         
     except PermissionError:
         msg = f"Error: No write permission for directory: {parent_dir}"
@@ -143,7 +191,7 @@ def verify_disk_space(min_required_gb=10):
     """Verify that there is sufficient disk space available."""
     logger.info("Verifying disk space...")
     local_available = get_available_space(os.getcwd())
-    local_available_gb = local_available/1024**3
+    local_available_gb = local_available/_GB
     
     msg = f"Available Disk Space: {local_available_gb:.2f} GB"
     if local_available_gb < min_required_gb:
@@ -165,7 +213,7 @@ def verify_steam_login(username, password, steam_guard_code, anonymous=False):
     logger.info(f"Verifying Steam login for {'anonymous' if anonymous else hash_credentials(username, password)}")
     
     steamcmd_path = os.path.join(os.getcwd(), "steamcmd", "steamcmd.sh")
-    if not os.path.exists(steamcmd_path):
+    if not steamcmd_ready(steamcmd_path):
         msg = "Error: SteamCMD not found. Please install dependencies first."
         logger.error(msg)
         log_flush()
@@ -208,9 +256,10 @@ def verify_steam_login(username, password, steam_guard_code, anonymous=False):
                 log_flush()
                 return msg
             else:
-                if "Steam Guard" in output or "Two-factor code" in output:
+                failure = _classify_login_failure(output)
+                if failure == "guard":
                     msg = "Error: Steam Guard code required or invalid."
-                elif "Invalid Password" in output or "Login Failure" in output:
+                elif failure == "password":
                     msg = "Error: Invalid username or password."
                 else:
                     msg = f"Error: Login failed: {output.strip()}"
@@ -241,8 +290,8 @@ def system_check():
     
     # Check disk space
     local_space = get_available_space(os.getcwd())
-    messages.append(f"Available Disk Space: {local_space/1024**3:.2f} GB")
-    if local_space < 10*1024**3:
+    messages.append(f"Available Disk Space: {local_space/_GB:.2f} GB")
+    if local_space < 10 * _GB:
         messages.append("WARNING: Less than 10GB available disk space!")
     
     # Check for steamcmd in multiple locations
@@ -313,7 +362,11 @@ def system_check():
     
     if found_7z:
         try:
-            result = subprocess.run(['7z', '--help'], capture_output=True, text=True)
+            # Run the binary that was actually found. Python's own descriptors
+            # are not inheritable, so close_fds can be skipped; with an absolute
+            # path that lets subprocess use its posix_spawn fast path.
+            result = subprocess.run([path, '--help'], capture_output=True, text=True,
+                                    close_fds=False)
             if result.returncode == 0:
                 messages.append("7z is working correctly.")
             else:
@@ -326,9 +379,12 @@ def system_check():
         # Try to install 7zip if not found
         try:
             messages.append("Attempting to install 7zip...")
-            result = subprocess.run(['apt-get', 'update'], capture_output=True, text=True)
-            install_result = subprocess.run(['apt-get', 'install', '-y', 'p7zip-full'], 
-                                           capture_output=True, text=True)
+            # One shell for update and install, without prompts or progress output
+            install_result = subprocess.run(
+                ['sh', '-c', 'apt-get update -qq && '
+                             'apt-get install -y -qq --no-install-recommends p7zip-full'],
+                capture_output=True, text=True,
+                env={**os.environ, 'DEBIAN_FRONTEND': 'noninteractive'})
             if install_result.returncode == 0:
                 messages.append("7zip installation successful.")
                 if shutil.which("7z"):
@@ -344,20 +400,21 @@ def system_check():
         for d in test_dirs:
             if not os.path.exists(d):
                 os.makedirs(d, exist_ok=True)
-            test_file = os.path.join(d, f".write_test_{secrets.token_hex(4)}")
-            with open(test_file, 'w') as f:
-                f.write('test')
-            os.remove(test_file)
+            probe_write(d)
         messages.append("Write permissions verified for all required directories.")
     except Exception as e:
         messages.append(f"ERROR: Write permission issue: {str(e)}")
     
     return "\n".join(messages)
 
+# Size fields in SteamCMD's app_info_print output
+_SIZE_ON_DISK_RE = re.compile(r'"SizeOnDisk"\s+"(\d+)"')
+_SIZE_RE = re.compile(r'"size"\s+"(\d+)"')
+
 def estimate_game_size(app_id, steamcmd_path):
     """Estimate the size of a game before downloading."""
     logger.info(f"Estimating game size for app id {app_id}")
-    if not os.path.exists(steamcmd_path):
+    if not steamcmd_ready(steamcmd_path):
         msg = "Error: SteamCMD not found."
         logger.error(msg)
         return msg, None
@@ -381,19 +438,19 @@ def estimate_game_size(app_id, steamcmd_path):
             logger.error(msg)
             return msg, None
             
-        match = re.search(r'"SizeOnDisk"\s+"(\d+)"', output)
+        match = _SIZE_ON_DISK_RE.search(output)
         if not match:
-            match = re.search(r'"size"\s+"(\d+)"', output)
+            match = _SIZE_RE.search(output)
             
         if match:
             size_bytes = int(match.group(1))
-            estimated_gb = size_bytes / 1024**3
+            estimated_gb = size_bytes / _GB
             msg = f"Estimated game size: {estimated_gb:.2f} GB"
             logger.info(msg)
             
             available_space = get_available_space(os.getcwd())
             if available_space < size_bytes * 1.5:
-                warning = f"WARNING: Available space ({available_space/1024**3:.2f} GB) may not be sufficient for this game ({estimated_gb:.2f} GB) plus overhead."
+                warning = f"WARNING: Available space ({available_space/_GB:.2f} GB) may not be sufficient for this game ({estimated_gb:.2f} GB) plus overhead."
                 logger.warning(warning)
                 msg += f"\n{warning}"
                 
@@ -407,6 +464,194 @@ def estimate_game_size(app_id, steamcmd_path):
         logger.error(msg)
         return msg, None
 
+# SteamCMD reports "progress: 12.34 (...)" while 7z reports "12%"
+_PROGRESS_RE = re.compile(r"progress:\s*(\d+(?:\.\d+)?)|(\d+)%")
+
+# A session that could not refresh AppInfo usually can't install the app
+# either, and is worth running again
+_APPINFO_FAILED_RE = re.compile(r"Failed to request AppInfo update")
+_APP_INSTALLED_RE = re.compile(r"Success! App '\d+' fully installed")
+
+# Archive format for finished downloads: "7z" writes split .7z volumes,
+# "zstd" writes a single .tar.zst using all cores, which is much faster on
+# game data at a similar ratio. zstd is the default when it is installed.
+COMPRESSION = os.getenv("COMPRESSION", "zstd").lower()
+_COMPRESSION_REQUESTED = "COMPRESSION" in os.environ
+# zstd tuning: 19 trades speed for ratio, 3 is much faster. Each worker at
+# --long=27 -19 needs roughly 140 MB, so 0 threads (the default) means one
+# per CPU this process may use, not zstd's -T0 (every core on the host).
+ZSTD_LEVEL = int(os.getenv("ZSTD_LEVEL", 19))
+ZSTD_THREADS = int(os.getenv("ZSTD_THREADS", 0))
+
+def _zstd_archive_path(output_path):
+    """Return the .tar.zst path used in place of a .7z output path."""
+    root, ext = os.path.splitext(output_path)
+    return (root if ext == ".7z" else output_path) + ".tar.zst"
+
+def _usable_cpus():
+    """Return how many CPUs this process may run on (container cpusets included)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 4
+
+def _compress_command(output_path):
+    """Return the compression command and the archive path it writes."""
+    if COMPRESSION == "zstd":
+        if has_tool("zstd"):
+            archive_path = _zstd_archive_path(output_path)
+            if ZSTD_LEVEL < 0:
+                # Negative levels are zstd's fast modes, spelled --fast=N
+                level = f"--fast={-ZSTD_LEVEL}"
+            else:
+                level = f"-{min(ZSTD_LEVEL, 22)}"
+                if ZSTD_LEVEL > 19:
+                    level += " --ultra"
+            threads = ZSTD_THREADS or _usable_cpus()
+            zstd = f"zstd --long=27 -T{threads} {level}"
+            return ['tar', f'--use-compress-program={zstd}',
+                    '-cf', archive_path, '-C', './game', '.'], archive_path
+        # Only worth a warning if zstd was asked for rather than just the default
+        log = logger.warning if _COMPRESSION_REQUESTED else logger.info
+        log("zstd is not installed, falling back to 7z")
+    # LZMA2 splits the stream into blocks that are compressed in parallel;
+    # ask for one thread per usable CPU instead of 7z's conservative default
+    return ['7z', 'a', '-t7z', '-m0=lzma2', f'-mmt={_usable_cpus()}',
+            '-v4g', output_path, './game'], None
+
+def _parse_progress(line):
+    """Return the progress percentage reported on an output line, or None."""
+    match = _PROGRESS_RE.search(line)
+    if not match:
+        return None
+    return float(match.group(1) or match.group(2))
+
+def _format_progress(label, progress, elapsed_time):
+    """Format a progress percentage with an estimate of the remaining time."""
+    total_time_est = elapsed_time / (progress / 100)
+    remaining_time = total_time_est - elapsed_time
+    minutes, seconds = divmod(int(remaining_time), 60)
+    hours, minutes = divmod(minutes, 60)
+    
+    if hours > 0:
+        time_remaining = f"~{hours}h {minutes}m remaining"
+    else:
+        time_remaining = f"~{minutes}m {seconds}s remaining"
+    return f"{label}: {int(progress)}% complete, {time_remaining}"
+
+def _iter_output(process, master_fd=None):
+    """Yield (is_stderr, line) pairs from a process's stdout and stderr.
+    
+    Both pipes are watched with a selector and read in 64 KiB chunks, so a
+    child writing heavily to one pipe never blocks while we wait on the other.
+    If the process runs on a pseudo-terminal, pass its master_fd instead; all
+    of its output then arrives there and is reported as stdout.
+    """
+    if master_fd is None:
+        stderr_fd = process.stderr.fileno()
+        pending = {process.stdout.fileno(): bytearray(), stderr_fd: bytearray()}
+    else:
+        stderr_fd = None
+        pending = {master_fd: bytearray()}
+    with selectors.DefaultSelector() as selector:
+        for fd in pending:
+            selector.register(fd, selectors.EVENT_READ)
+        while selector.get_map():
+            for key, _ in selector.select():
+                fd = key.fd
+                buffer = pending[fd]
+                try:
+                    chunk = os.read(fd, 65536)
+                except OSError:
+                    # A pty master reports EIO once the child side is closed
+                    chunk = b""
+                if not chunk:
+                    selector.unregister(fd)
+                    if buffer:
+                        yield fd == stderr_fd, buffer.decode("utf-8", "replace")
+                    continue
+                # Progress meters redraw with a bare carriage return; treat it
+                # as a line break the way text-mode pipes did
+                buffer += chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+                end = buffer.rfind(b"\n")
+                if end < 0:
+                    continue
+                for line in bytes(buffer[:end]).split(b"\n"):
+                    yield fd == stderr_fd, line.decode("utf-8", "replace")
+                del buffer[:end + 1]
+
+def _stream_progress(process, label, output_prefix, status_messages, master_fd=None):
+    """Log a subprocess's output, turning progress lines into status updates.
+    
+    Progress lines arrive far more often than the percentage changes, so they
+    are only reported when progress moved by at least 1% or 0.5s have passed.
+    Returns the lines the process wrote to stderr.
+    """
+    start_time = time.time()
+    last_progress = -1.0
+    last_emit = 0.0
+    error_lines = []
+    for is_stderr, line in _iter_output(process, master_fd):
+        if is_stderr:
+            error_lines.append(line)
+            continue
+        line = line.strip()
+        progress = _parse_progress(line)
+        if not progress:
+            status_messages.append(line)
+            logger.info("%s: %s", output_prefix, line)
+            log_flush()
+            continue
+        
+        now = time.monotonic()
+        if abs(progress - last_progress) < 1.0 and now - last_emit < 0.5:
+            continue
+        last_progress, last_emit = progress, now
+        
+        status = _format_progress(label, progress, time.time() - start_time)
+        status_messages.append(status)
+        logger.info(status)
+        log_flush()
+    return error_lines
+
+def _has_any_file(root):
+    """Return True as soon as a regular file is found anywhere under root."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        return True
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return False
+
+def _run_download(cmd_download, app_id, status_messages):
+    """Run a SteamCMD download session, streaming its output; return its exit code."""
+    # SteamCMD block-buffers its output when writing to a pipe, so progress
+    # would only show up in 4 KiB bursts. Give it a pseudo-terminal instead,
+    # which keeps it line-buffered.
+    master_fd, slave_fd = pty.openpty()
+    try:
+        try:
+            process_download = subprocess.Popen(
+                cmd_download,
+                stdin=subprocess.DEVNULL,
+                stdout=slave_fd,
+                stderr=slave_fd
+            )
+        finally:
+            os.close(slave_fd)
+        register_process(process_download, f"download_{app_id}")
+        
+        _stream_progress(process_download, "Downloading", "Download output", status_messages, master_fd)
+        return process_download.wait()
+    finally:
+        os.close(master_fd)
+
 def download_and_compress(username, password, steam_guard_code, app_id, output_path, anonymous=False, resume=False):
     """Download and compress a game using SteamCMD."""
     credentials_hash = "anonymous" if anonymous else hash_credentials(username, password)
@@ -420,7 +665,7 @@ def download_and_compress(username, password, steam_guard_code, app_id, output_p
 
     # Check disk space
     local_available = get_available_space(os.getcwd())
-    if local_available < 10*1024**3:
+    if local_available < 10 * _GB:
         warning = "Warning: Less than 10GB available on disk. Download may fail."
         logger.warning(warning)
         
@@ -444,20 +689,24 @@ def download_and_compress(username, password, steam_guard_code, app_id, output_p
 
     # Locate steamcmd
     steamcmd_path = os.path.join(os.getcwd(), "steamcmd", "steamcmd.sh")
-    if not os.path.exists(steamcmd_path):
+    if not steamcmd_ready(steamcmd_path):
         error_msg = "Error: SteamCMD not found."
         logger.error(error_msg)
         return "", error_msg
 
     # Login to Steam
     if anonymous:
-        cmd_login = [steamcmd_path, '+login', 'anonymous', '+quit']
+        login_args = ['+login', 'anonymous']
+        cmd_login = [steamcmd_path] + login_args + ['+quit']
         logger.info("Using anonymous login for download.")
     else:
-        cmd_login = [steamcmd_path]
+        # The download session logs in again, so it needs the Steam Guard
+        # code too; there is no stdin to answer a prompt with
+        login_args = []
         if steam_guard_code:
-            cmd_login += ['+set_steam_guard_code', steam_guard_code]
-        cmd_login += ['+login', username, password, '+quit']
+            login_args += ['+set_steam_guard_code', steam_guard_code]
+        login_args += ['+login', username, password]
+        cmd_login = [steamcmd_path] + login_args + ['+quit']
         
     logger.info('Attempting to log in...')
     log_flush()
@@ -487,9 +736,10 @@ def download_and_compress(username, password, steam_guard_code, app_id, output_p
         log_flush()
         
         if "Waiting for user info...OK" not in output_login:
-            if "Steam Guard" in output_login or "Two-factor code" in output_login:
+            failure = _classify_login_failure(output_login)
+            if failure == "guard":
                 error_msg = "Steam Guard code required or invalid. Check your email or authenticator."
-            elif "Invalid Password" in output_login or "Login Failure" in output_login:
+            elif failure == "password":
                 error_msg = "Invalid username or password."
             else:
                 error_msg = f"Login failed: {output_login.strip()}"
@@ -507,117 +757,45 @@ def download_and_compress(username, password, steam_guard_code, app_id, output_p
         log_flush()
         return "", error_msg
 
-    # Update app info
-    try:
-        max_attempts = 3
-        app_info_updated = False
-        
-        for attempt in range(max_attempts):
-            logger.info(f"Attempt {attempt+1} to update AppInfo...")
-            update_proc = subprocess.Popen(
-                [steamcmd_path, '+app_info_update', '1', '+quit'], 
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            register_process(update_proc, f"update_app_info_{app_id}")
-            
-            try:
-                update_output, update_error = update_proc.communicate(timeout=60)
-            except subprocess.TimeoutExpired:
-                update_proc.kill()
-                update_output, update_error = update_proc.communicate()
-                logger.warning("AppInfo update timed out, retrying...")
-                continue
-                
-            logger.info(f"AppInfo update output: {update_output}")
-            if update_error:
-                logger.warning(f"AppInfo update error: {update_error}")
-                
-            if "Failed to request AppInfo update" not in update_output:
-                logger.info("AppInfo update successful.")
-                app_info_updated = True
-                break
-            else:
-                logger.warning("AppInfo update failed, retrying...")
-                log_flush()
-                time.sleep(5)
-                
-        if not app_info_updated:
-            logger.warning("Could not update AppInfo after multiple attempts, proceeding anyway.")
-    except Exception as e:
-        logger.error(f"Exception during AppInfo update: {str(e)}")
-    
-    # Download game
+    # Download game. AppInfo is refreshed in the same SteamCMD session rather
+    # than paying for a separate client start-up, login and CDN handshake.
     cmd_download = [
         steamcmd_path,
         '+force_install_dir', './game',
+        *login_args,
+        '+app_info_update', '1',
         '+app_update', app_id, 'validate',
         '+quit'
     ]
     logger.info('Starting download...')
     log_flush()
     
+    # Only the most recent output is reported back; a long download can print
+    # tens of thousands of lines
+    status_messages = deque(maxlen=100)
     try:
-        process_download = subprocess.Popen(
-            cmd_download,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        register_process(process_download, f"download_{app_id}")
-        
-        download_start_time = time.time()
-        status_messages = []
-        
-        # Process stdout
-        for line in process_download.stdout:
-            if '%' in line:
-                try:
-                    progress_match = re.search(r'(\d+)%', line)
-                    if progress_match:
-                        progress = int(progress_match.group(1))
-                        elapsed_time = time.time() - download_start_time
-                        if progress > 0:
-                            total_time_est = elapsed_time / (progress / 100)
-                            remaining_time = total_time_est - elapsed_time
-                            minutes, seconds = divmod(int(remaining_time), 60)
-                            hours, minutes = divmod(minutes, 60)
-                            
-                            time_remaining = ""
-                            if hours > 0:
-                                time_remaining = f"~{hours}h {minutes}m remaining"
-                            else:
-                                time_remaining = f"~{minutes}m {seconds}s remaining"
-                                
-                            status = f"Downloading: {progress}% complete, {time_remaining}"
-                            status_messages.append(status)
-                            logger.info(status)
-                            log_flush()
-                        else:
-                            status_messages.append(line.strip())
-                            logger.info(line.strip())
-                            log_flush()
-                except Exception as e:
-                    logger.warning(f"Failed to parse download progress: {line.strip()}, error: {str(e)}")
-                    status_messages.append(line.strip())
-                    log_flush()
-            else:
-                status_messages.append(line.strip())
-                logger.info(f"Download output: {line.strip()}")
+        max_attempts = 3
+        for attempt in range(max_attempts):
+            status_messages.clear()
+            returncode = _run_download(cmd_download, app_id, status_messages)
+            output = "\n".join(status_messages)
+            if not _APPINFO_FAILED_RE.search(output) or _APP_INSTALLED_RE.search(output):
+                break
+            if attempt < max_attempts - 1:
+                logger.warning("AppInfo update failed, retrying download session...")
                 log_flush()
-                
-        process_download.wait()
+                time.sleep(5)
         
-        if process_download.returncode != 0:
+        if returncode != 0:
+            # stdout and stderr share the terminal, so report the last lines
             error_output = ""
-            for line in process_download.stderr:
-                error_output += line
-                logger.error(f"Download error: {line.strip()}")
+            for line in list(status_messages)[-10:]:
+                error_output += line + "\n"
+                logger.error("Download error: %s", line.strip())
                 
-            logger.error(f"Download failed with code {process_download.returncode}")
+            logger.error(f"Download failed with code {returncode}")
             log_flush()
-            return "\n".join(status_messages), f"Download failed with code {process_download.returncode}: {error_output}"
+            return "\n".join(status_messages), f"Download failed with code {returncode}: {error_output}"
     except Exception as e:
         error_msg = f"Exception during download: {str(e)}"
         logger.error(error_msg)
@@ -625,66 +803,34 @@ def download_and_compress(username, password, steam_guard_code, app_id, output_p
         return "\n".join(status_messages) if status_messages else "", error_msg
 
     # Compression
+    if not _has_any_file("./game"):
+        error_msg = "Download finished but no game files were found to compress."
+        logger.error(error_msg)
+        log_flush()
+        return "\n".join(status_messages), error_msg
+    
     logger.info('Starting compression...')
     status_messages.append('Starting compression...')
     log_flush()
     
     try:
-        cmd_compress = ['7z', 'a', '-t7z', '-v4g', output_path, './game']
+        cmd_compress, archive_path = _compress_command(output_path)
         process_compress = subprocess.Popen(
             cmd_compress,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.PIPE
         )
         register_process(process_compress, f"compress_{app_id}")
         
-        compress_start_time = time.time()
-        
-        # Process stdout
-        for line in process_compress.stdout:
-            if '%' in line:
-                try:
-                    progress_match = re.search(r'(\d+)%', line)
-                    if progress_match:
-                        progress = int(progress_match.group(1))
-                        elapsed_time = time.time() - compress_start_time
-                        if progress > 0:
-                            total_time_est = elapsed_time / (progress / 100)
-                            remaining_time = total_time_est - elapsed_time
-                            minutes, seconds = divmod(int(remaining_time), 60)
-                            hours, minutes = divmod(minutes, 60)
-                            
-                            time_remaining = ""
-                            if hours > 0:
-                                time_remaining = f"~{hours}h {minutes}m remaining"
-                            else:
-                                time_remaining = f"~{minutes}m {seconds}s remaining"
-                                
-                            status = f"Compressing: {progress}% complete, {time_remaining}"
-                            status_messages.append(status)
-                            logger.info(status)
-                            log_flush()
-                        else:
-                            status_messages.append(line.strip())
-                            logger.info(line.strip())
-                            log_flush()
-                except Exception as e:
-                    logger.warning(f"Failed to parse compression progress: {line.strip()}, error: {str(e)}")
-                    status_messages.append(line.strip())
-                    log_flush()
-            else:
-                status_messages.append(line.strip())
-                logger.info(f"Compression output: {line.strip()}")
-                log_flush()
+        error_lines = _stream_progress(process_compress, "Compressing", "Compression output", status_messages)
                 
         process_compress.wait()
         
         if process_compress.returncode != 0:
             error_output = ""
-            for line in process_compress.stderr:
-                error_output += line
-                logger.error(f"Compression error: {line.strip()}")
+            for line in error_lines:
+                error_output += line + "\n"
+                logger.error("Compression error: %s", line.strip())
                 
             logger.error(f"Compression failed with code {process_compress.returncode}")
             log_flush()
@@ -701,22 +847,33 @@ def download_and_compress(username, password, steam_guard_code, app_id, output_p
     except Exception as e:
         logger.warning(f"Failed to clean up game directory: {str(e)}")
         
-    completion_msg = f"Completed! Files saved as {output_path}.001, {output_path}.002, etc."
+    if archive_path:
+        completion_msg = f"Completed! File saved as {archive_path}"
+    else:
+        completion_msg = f"Completed! Files saved as {output_path}.001, {output_path}.002, etc."
     logger.info(completion_msg)
     log_flush()
     return "\n".join(status_messages) + "\n" + completion_msg, ""
 
+@functools.lru_cache(maxsize=256)
+def extract_app_id(steam_url):
+    """Return the app ID from a Steam store URL or bare ID, or None if there isn't one."""
+    # A bare ID is the cheaper check, so try it first
+    match = _NUM_RE.match(steam_url) or _URL_APP_RE.search(steam_url)
+    if not match:
+        return None
+    return match.group(1)
+
 def download_and_compress_from_url(username, password, steam_guard_code, anonymous, steam_url, output_path, resume=False):
     """Extract app ID from URL and start download process."""
     logger.info(f"Extracting app ID from URL: {steam_url}")
-    match = re.search(r"/app/(\d+)", steam_url)
-    if not match:
+    app_id = extract_app_id(steam_url)
+    if not app_id:
         error_msg = "Error: Could not extract App ID from Steam URL."
         logger.error(error_msg)
         log_flush()
         return "", error_msg
         
-    app_id = match.group(1)
     logger.info(f"Extracted App ID: {app_id}")
     log_flush()
     
@@ -745,7 +902,7 @@ def download_and_compress_from_url(username, password, steam_guard_code, anonymo
         available_space = get_available_space(os.getcwd())
         required_space = size_bytes * 1.5  # 50% buffer for installation and compression
         if available_space < required_space:
-            warning = f"WARNING: Available space ({available_space/1024**3:.2f} GB) may not be sufficient for this game ({size_bytes/1024**3:.2f} GB) plus overhead."
+            warning = f"WARNING: Available space ({available_space/_GB:.2f} GB) may not be sufficient for this game ({size_bytes/_GB:.2f} GB) plus overhead."
             logger.warning(warning)
             status_messages.append(warning)
     
@@ -758,7 +915,7 @@ def download_and_compress_from_url(username, password, steam_guard_code, anonymo
 # === Queue Management ===
 
 download_queue = Queue()
-queue_status = []
+queue_status = deque(maxlen=100)  # Oldest entries drop off automatically
 queue_lock = threading.Lock()  # Add lock for thread safety
 
 def process_queue():
@@ -780,15 +937,11 @@ def process_queue():
             result = "Completed" if not error else f"Failed: {error}"
             with queue_lock:
                 queue_status.append(f"Task {task_id} {result}")
-                if len(queue_status) > 100:
-                    queue_status.pop(0)
                     
             logger.info(f"Download task {task_id} completed with status: {result}")
         except Exception as e:
             with queue_lock:
                 queue_status.append(f"Task {task_id} failed with exception: {str(e)}")
-                if len(queue_status) > 100:
-                    queue_status.pop(0)
             logger.error(f"Exception in download task {task_id}: {str(e)}")
         finally:
             download_queue.task_done()
@@ -832,8 +985,6 @@ def add_to_queue(username, password, steam_guard_code, anonymous, steam_url, out
         logger.info(f"Added task {task_id} to download queue")
         with queue_lock:
             queue_status.append(f"Task {task_id} for {steam_url} added to queue")
-            if len(queue_status) > 100:
-                queue_status.pop(0)
     except Exception as e:
         logger.error(f"Failed to save queue task: {str(e)}")
     return task_id
@@ -884,20 +1035,34 @@ except Exception as e:
 def get_downloaded_files(output_path=None):
     """
     Return a list of downloaded file parts or the main file if parts are not found.
+    A .tar.zst archive written by the zstd format is reported as well, listed
+    first when zstd is the configured format.
     If no output_path is provided, defaults to "./output/game.7z".
     """
     if not output_path:
         output_path = os.path.join(os.getcwd(), "output", "game.7z")
-    base = output_path
+    output_dir = os.path.dirname(output_path) or "."
+    base_name = os.path.basename(output_path)
+    
+    # Read the output directory once instead of probing each volume name
+    try:
+        with os.scandir(output_dir) as it:
+            names = {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        return "No downloaded files found."
+    
     files = []
     i = 1
-    while True:
-        part_file = f"{base}.{str(i).zfill(3)}"
-        if os.path.exists(part_file):
-            files.append(part_file)
-            i += 1
-        else:
-            break
-    if not files and os.path.exists(output_path):
+    while f"{base_name}.{str(i).zfill(3)}" in names:
+        files.append(f"{output_path}.{str(i).zfill(3)}")
+        i += 1
+    if not files and base_name in names:
         files.append(output_path)
+    # Report both formats, so leftover .7z volumes can't hide a new archive
+    zstd_path = _zstd_archive_path(output_path)
+    if os.path.basename(zstd_path) in names:
+        if COMPRESSION == "zstd":
+            files.insert(0, zstd_path)
+        else:
+            files.append(zstd_path)
     return "\n".join(files) if files else "No downloaded files found."
\ No newline at end of file
@@ -23,7 +23,7 @@ if command -v 7z &> /dev/null; then
     echo "7zip is already installed at $(which 7z)."
 else
     echo "Installing 7zip..."
-    apt-get update && apt-get install -y p7zip-full
+    apt-get update -qq && DEBIAN_FRONTEND=noninteractive apt-get install -y -qq --no-install-recommends p7zip-full
     
     # Verify installation
     if command -v 7z &> /dev/null; then
@@ -34,6 +34,16 @@ else
     fi
 fi
 
+# zstd is optional; without it archives are written with 7z instead
+if command -v zstd &> /dev/null; then
+    echo "zstd is already installed at $(which zstd)."
+else
+    echo "Installing zstd..."
+    apt-get update -qq && DEBIAN_FRONTEND=noninteractive apt-get install -y -qq --no-install-recommends zstd || {
+        echo "WARNING: zstd installation failed, archives will use 7z."
+    }
+fi
+
 # Check for steamcmd directory
 STEAMCMD_DIR="${APP_DIR}/steamcmd"
 if [ -d "$STEAMCMD_DIR" ] && [ -f "${STEAMCMD_DIR}/steamcmd.sh" ]; then
@@ -49,39 +59,29 @@ if [ -d "$STEAMCMD_DIR" ] && [ -f "${STEAMCMD_DIR}/steamcmd.sh" ]; then
 else
     echo "Installing SteamCMD to ${STEAMCMD_DIR}..."
     mkdir -p "$STEAMCMD_DIR"
-    cd "$STEAMCMD_DIR"
     
-    # Download and extract SteamCMD
-    echo "Downloading SteamCMD..."
-    if wget -q https://steamcdn-a.akamaihd.net/client/installer/steamcmd_linux.tar.gz; then
-        echo "SteamCMD download successful."
+    # Download and extract SteamCMD in one pass, without writing the tarball to disk.
+    # Paths are passed explicitly instead of cd-ing around, so a relative APP_DIR
+    # keeps pointing at the same place for the rest of the script.
+    echo "Downloading and extracting SteamCMD..."
+    if wget -qO- https://steamcdn-a.akamaihd.net/client/installer/steamcmd_linux.tar.gz | tar -xzf - -C "$STEAMCMD_DIR"; then
+        echo "SteamCMD download and extraction successful."
     else
-        echo "ERROR: Failed to download SteamCMD!"
+        echo "ERROR: Failed to download or extract SteamCMD!"
         exit 1
     fi
     
-    echo "Extracting SteamCMD..."
-    if tar -xzf steamcmd_linux.tar.gz; then
-        echo "SteamCMD extraction successful."
-    else
-        echo "ERROR: Failed to extract SteamCMD!"
-        exit 1
-    fi
-    
-    rm steamcmd_linux.tar.gz
-    
     # Make executable
     echo "Setting permissions..."
-    chmod +x steamcmd.sh
+    chmod +x "${STEAMCMD_DIR}/steamcmd.sh"
     
     # Run SteamCMD to update itself
     echo "Running SteamCMD initial update..."
-    ./steamcmd.sh +quit || {
+    "${STEAMCMD_DIR}/steamcmd.sh" +quit || {
         echo "WARNING: SteamCMD initial update failed, but continuing anyway."
     }
     
     echo "SteamCMD installed successfully."
-    cd "$APP_DIR"
 fi
 
 # Create symlinks in standard paths
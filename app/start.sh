@@ -31,7 +31,7 @@ if command -v 7z &>/dev/null; then
     echo "7zip found at $(which 7z)"
 else
     echo "ERROR: 7zip not found in PATH"
-    apt-get update && apt-get install -y p7zip-full
+    apt-get update -qq && DEBIAN_FRONTEND=noninteractive apt-get install -y -qq --no-install-recommends p7zip-full
     if command -v 7z &>/dev/null; then
         echo "7zip installed successfully at $(which 7z)"
     else
@@ -39,6 +39,15 @@ else
     fi
 fi
 
+echo "Checking for zstd:"
+if command -v zstd &>/dev/null; then
+    echo "zstd found at $(which zstd)"
+else
+    # Optional: archives fall back to 7z without it
+    apt-get update -qq && DEBIAN_FRONTEND=noninteractive apt-get install -y -qq --no-install-recommends zstd \
+        || echo "WARNING: Failed to install zstd, archives will use 7z"
+fi
+
 # Skip dependency installation when running in a Docker container
 if [ -f "/.dockerenv" ]; then
     echo "Running in Docker container - dependencies should already be installed"
@@ -0,0 +1,186 @@
+import os
+import re
+import asyncio
+import time
+import threading
+from collections import deque
+
+TITLES = {
+    "demo": "# Game Downloader and Compressor - Setup Demo",
+    "setup": "# Game Downloader and Compressor - Setup",
+}
+
+# Lines worth showing right away instead of waiting for the next UI update
+_IMPORTANT_RE = re.compile(r"ERROR|WARNING|successfully")
+
+# Installs left running after their client went away; kept referenced so
+# the tasks aren't garbage collected before they finish
+_background_installs = set()
+
+async def _finish_install(process, stderr_task):
+    """Keep draining an abandoned install so the script can run to completion"""
+    while await process.stdout.read(65536):
+        pass
+    if stderr_task:
+        await stderr_task
+    return_code = await process.wait()
+    print(f"Background installation finished with code {return_code}")
+
+async def install_dependencies():
+    """Run the install_dependencies.sh script to set up SteamCMD and 7zip"""
+    status = ""
+    process = None
+    stderr_task = None
+    try:
+        # An abandoned install still finishing in the background holds the
+        # apt lock and the steamcmd directory; don't start a second one
+        if _background_installs:
+            yield "An earlier installation is still finishing in the background. Please try again shortly."
+            return
+        
+        # Check if script exists
+        if not os.path.exists("./install_dependencies.sh"):
+            yield "Error: install_dependencies.sh not found."
+            return
+        
+        # Make script executable if it isn't already
+        os.chmod("./install_dependencies.sh", 0o755)
+        
+        print("Starting dependency installation process...")
+        
+        # Run the script without blocking the event loop, so other sessions
+        # stay responsive while the installation is streaming output
+        process = await asyncio.create_subprocess_exec(
+            "bash", "./install_dependencies.sh",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        # Drain stderr in the background so a chatty script can't fill the pipe
+        stderr_task = asyncio.create_task(process.stderr.read())
+        
+        # Capture and display output in real-time, keeping only the most
+        # recent lines and coalescing UI updates
+        status_lines = deque(maxlen=100)
+        last_yield = time.monotonic()
+        # Read the pipe in large chunks and split lines ourselves rather than
+        # waking up once per line
+        pending = b""
+        while True:
+            chunk = await process.stdout.read(65536)
+            if not chunk:
+                break
+            *complete, pending = (pending + chunk).split(b"\n")
+            important = False
+            for raw_line in complete:
+                line = raw_line.decode(errors="replace").strip()
+                status_lines.append(line)
+                print(f"INSTALL: {line}")
+                important = important or _IMPORTANT_RE.search(line) is not None
+            now = time.monotonic()
+            if important or now - last_yield >= 0.25:
+                last_yield = now
+                yield "\n".join(status_lines)
+        if pending:
+            line = pending.decode(errors="replace").strip()
+            status_lines.append(line)
+            print(f"INSTALL: {line}")
+            
+        # Get the return code
+        return_code = await process.wait()
+        
+        # Capture any stderr output
+        stderr_output = (await stderr_task).decode(errors="replace")
+        if stderr_output:
+            status_lines.append(f"STDERR: {stderr_output}")
+            print(f"INSTALL ERROR: {stderr_output}")
+        
+        status = "\n".join(status_lines)
+        
+        if return_code != 0:
+            status += f"\nError (code {return_code}): Installation failed. Please check logs."
+        else:
+            status += "\nDependencies installed successfully!"
+        
+        yield status
+    except Exception as e:
+        error_msg = f"Exception during installation: {str(e)}"
+        print(f"INSTALL EXCEPTION: {error_msg}")
+        yield f"{status}\n{error_msg}" if status else error_msg
+    finally:
+        # If Gradio closes the generator early (e.g. the client disconnected),
+        # let the script finish rather than killing apt-get halfway through
+        if process is not None and (process.returncode is None
+                                    or (stderr_task and not stderr_task.done())):
+            print("Installation output abandoned, finishing in the background...")
+            task = asyncio.ensure_future(_finish_install(process, stderr_task))
+            _background_installs.add(task)
+            task.add_done_callback(_background_installs.discard)
+
+def greet(name):
+    return f"Hello, {name}! Server is up and running."
+
+# Refreshed by the page every 60 seconds; each tick is a single quick call
+def update_status():
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    return f"Server running at {timestamp}. Interface is accessible via network."
+
+def create_app(mode="setup"):
+    """Build the setup interface shared by main.py and setup.py.
+    
+    "setup" mode adds the periodically refreshed system status panel.
+    """
+    # Imported here so that importing this module doesn't pull in gradio
+    import gradio as gr
+    
+    with gr.Blocks() as demo:
+        gr.Markdown(TITLES[mode])
+        
+        with gr.Tab("System Setup"):
+            install_output = gr.Textbox(label="Installation Output", lines=10)
+            install_btn = gr.Button("Install Dependencies (SteamCMD & 7zip)")
+            # Only one installer may run at a time; other endpoints stay available
+            install_btn.click(fn=install_dependencies, inputs=[], outputs=install_output,
+                              concurrency_limit=1, concurrency_id="install")
+        
+        with gr.Tab("Test Connection"):
+            name_input = gr.Textbox(label="Enter your name", value="World")
+            greet_output = gr.Textbox(label="Server Response")
+            test_btn = gr.Button("Test Connection")
+            # Cheap enough to answer directly, even while an install is running
+            test_btn.click(fn=greet, inputs=[name_input], outputs=[greet_output], queue=False)
+        
+        if mode == "setup":
+            # System status indicator
+            system_status = gr.Textbox(
+                label="System Status", 
+                value="Server running. Interface is accessible via network.", 
+                interactive=False
+            )
+            demo.load(update_status, None, system_status, every=60)
+    
+    return demo
+
+def launch_app(demo):
+    """Launch the interface on $PORT and keep the process running."""
+    port = int(os.getenv("PORT", 7860))
+    print(f"Starting Gradio server on port {port}")
+    
+    # In Railway, we need to bind to 0.0.0.0; the public URL already routes to
+    # PORT, so a Gradio share tunnel is only opened when GRADIO_SHARE=1
+    demo.queue(default_concurrency_limit=8, max_size=20)  # Add a queue to handle multiple requests
+    demo.launch(
+        server_name="0.0.0.0",  # Critical - bind to all interfaces
+        server_port=port,
+        share=os.getenv("GRADIO_SHARE", "0") == "1",  # Opt-in share tunnel
+        debug=os.getenv("DEBUG", "false").lower() == "true",
+        show_error=True,  # Show detailed error messages
+        max_threads=int(os.getenv("THREAD_POOL_SIZE", 64)),  # Worker threads for sync handlers
+        prevent_thread_lock=True  # Prevent thread locking for better stability
+    )
+    
+    # Keep the script running without waking up periodically
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        print("Server stopped by user")